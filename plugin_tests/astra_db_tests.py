@@ -26,4 +26,8 @@ ASTRA_DB_CONFIG = {
 
 FULL_REPO_CONFIGS = [
     IntegrationTestRepoConfig(online_store=ASTRA_DB_CONFIG),
+    IntegrationTestRepoConfig(online_store={
+        **ASTRA_DB_CONFIG,
+        "row_layout": "wide",
+    }),
 ]
@@ -42,4 +42,8 @@ CASSANDRA_CONFIG = {
 
 FULL_REPO_CONFIGS = [
     IntegrationTestRepoConfig(online_store=CASSANDRA_CONFIG),
+    IntegrationTestRepoConfig(online_store={
+        **CASSANDRA_CONFIG,
+        "row_layout": "wide",
+    }),
 ]
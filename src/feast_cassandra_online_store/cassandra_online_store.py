@@ -17,9 +17,10 @@
 """
 
 import logging
+import functools
 from datetime import datetime
 from typing import (Sequence, List, Optional, Tuple, Dict, Callable,
-                    Any, Iterable)
+                    Any, Iterable, Set)
 
 from feast import RepoConfig, FeatureView, Entity
 from feast.infra.key_encoding_utils import serialize_entity_key
@@ -34,6 +35,9 @@ from pydantic.typing import Literal
 
 from cassandra.cluster import Cluster, Session, ResultSet
 from cassandra.auth import PlainTextAuthProvider
+from cassandra.query import PreparedStatement
+from cassandra.concurrent import (execute_concurrent,
+                                  execute_concurrent_with_args)
 #
 from cassandra.policies import DCAwareRoundRobinPolicy, TokenAwarePolicy
 from cassandra.cluster import ExecutionProfile
@@ -58,6 +62,14 @@ E_CASSANDRA_INCONSISTENT_AUTH = (
 E_CASSANDRA_UNKNOWN_LB_POLICY = (
     "Unknown/unsupported Load Balancing Policy name in Cassandra configuration"
 )
+E_CASSANDRA_OUTDATED_TABLE_SCHEMA = (
+    "Table {fqtable} has a non-blob 'entity_key' column, as created by "
+    "versions before 0.2.0: drop and re-create it (e.g. 'feast teardown' "
+    "and 'feast apply') and materialize again"
+)
+E_CASSANDRA_NONPOSITIVE_WRITE_SETTINGS = (
+    "Cassandra 'write_batch_size' and 'write_concurrency' must be at least 1"
+)
 
 # CQL command templates (that is, before replacing schema names)
 INSERT_CQL_4_TEMPLATE = ("INSERT INTO {fqtable} (feature_name,"
@@ -68,12 +80,22 @@ INSERT_CQL_5_TEMPLATE = ("INSERT INTO {fqtable} (feature_name, "
                          "value, entity_key, event_ts, created_ts)"
                          " VALUES (?, ?, ?, ?, ?);")
 
+UPDATE_WIDE_CQL_3_TEMPLATE = ("UPDATE {fqtable} SET features = features + ?,"
+                              " event_ts = ? WHERE entity_key = ?;")
+
+UPDATE_WIDE_CQL_4_TEMPLATE = ("UPDATE {fqtable} SET features = features + ?,"
+                              " event_ts = ?, created_ts = ?"
+                              " WHERE entity_key = ?;")
+
 SELECT_CQL_TEMPLATE = ("SELECT {columns} FROM {fqtable}"
                        " WHERE entity_key = ?;")
 
+SELECT_IN_CQL_TEMPLATE = ("SELECT {columns} FROM {fqtable}"
+                          " WHERE entity_key = ? AND feature_name IN ?;")
+
 CREATE_TABLE_CQL_TEMPLATE = """
     CREATE TABLE IF NOT EXISTS {fqtable} (
-        entity_key      TEXT,
+        entity_key      BLOB,
         feature_name    TEXT,
         value           BLOB,
         event_ts        TIMESTAMP,
@@ -82,6 +104,16 @@ CREATE_TABLE_CQL_TEMPLATE = """
     ) WITH CLUSTERING ORDER BY (feature_name ASC);
 """
 
+CREATE_WIDE_TABLE_CQL_TEMPLATE = """
+    CREATE TABLE IF NOT EXISTS {fqtable} (
+        entity_key      BLOB,
+        features        MAP<TEXT, BLOB>,
+        event_ts        TIMESTAMP,
+        created_ts      TIMESTAMP,
+        PRIMARY KEY (entity_key)
+    );
+"""
+
 DROP_TABLE_CQL_TEMPLATE = "DROP TABLE IF EXISTS {fqtable};"
 
 # op_name -> (cql template string, prepare boolean)
@@ -89,16 +121,33 @@ CQL_TEMPLATE_MAP = {
     # Queries/DML, statements to be prepared
     'insert4': (INSERT_CQL_4_TEMPLATE, True),
     'insert5': (INSERT_CQL_5_TEMPLATE, True),
+    'update3': (UPDATE_WIDE_CQL_3_TEMPLATE, True),
+    'update4': (UPDATE_WIDE_CQL_4_TEMPLATE, True),
     'select': (SELECT_CQL_TEMPLATE, True),
+    'select_in': (SELECT_IN_CQL_TEMPLATE, True),
     # DDL, do not prepare these
     'drop': (DROP_TABLE_CQL_TEMPLATE, False),
     'create': (CREATE_TABLE_CQL_TEMPLATE, False),
+    'create_wide': (CREATE_WIDE_TABLE_CQL_TEMPLATE, False),
 }
 
+# Max number of in-flight requests when issuing reads concurrently
+READ_CONCURRENCY = 100
+# Max number of requested features to filter with "feature_name IN ?"
+MAX_SELECT_IN_FEATURES = 20
+# Max number of in-flight schema changes (create/drop table)
+DDL_CONCURRENCY = 4
+
 # Logger
 logger = logging.getLogger(__name__)
 
 
+@functools.lru_cache(maxsize=32)
+def _cols_str(proj: Optional[Tuple[str, ...]]) -> str:
+    """Render a projection (None meaning all columns) for a CQL select."""
+    return "*" if proj is None else ", ".join(proj)
+
+
 class CassandraInvalidConfig(Exception):
     def __init__(self, msg: str):
         super().__init__(msg)
@@ -144,6 +193,12 @@ class CassandraOnlineStoreConfig(FeastConfigBaseModel):
     protocol_version: Optional[StrictInt] = None
     """Explicit specification of the CQL protocol version used."""
 
+    compression: Optional[Literal["lz4", "snappy", "none"]] = None
+    """
+    Compression of the traffic with the cluster. If omitted, either
+    lz4 or snappy is used, whichever is installed (lz4 preferred).
+    """
+
     class CassandraLoadBalancingPolicy(FeastConfigBaseModel):
         """
         Configuration block related to the Cluster's load-balancing policy.
@@ -166,6 +221,23 @@ class CassandraOnlineStoreConfig(FeastConfigBaseModel):
     wrapped into an execution profile if present.
     """
 
+    write_concurrency: StrictInt = 100
+    """Max number of in-flight write requests while writing a batch."""
+
+    write_batch_size: StrictInt = 1000
+    """
+    Number of entities whose writes are dispatched (concurrently)
+    at once, before moving on to the next ones.
+    """
+
+    row_layout: Literal["tall", "wide"] = "tall"
+    """
+    How features are laid out in the tables:
+        "tall": one row per (entity, feature) pair;
+        "wide": one row per entity, with all features in a map column.
+    Tables are not migrated between layouts.
+    """
+
 class CassandraOnlineStore(OnlineStore):
     """
     Cassandra/Astra DB online store implementation for Feast.
@@ -181,7 +253,13 @@ class CassandraOnlineStore(OnlineStore):
     _cluster: Cluster = None
     _session: Session = None
     _keyspace: str = None
-    _prepared_statements = {}
+
+    def __init__(self):
+        super().__init__()
+        # per-instance, as prepared statements belong to a specific Session
+        self._prepared_statements: Dict[tuple, PreparedStatement] = {}
+        # tables whose schema was found compatible with this version
+        self._checked_tables: Set[str] = set()
 
     def _get_session(self, config: RepoConfig):
         """
@@ -208,6 +286,7 @@ class CassandraOnlineStore(OnlineStore):
             username = online_store_config.username
             password = online_store_config.password
             protocol_version = online_store_config.protocol_version
+            compression = online_store_config.compression
 
             db_directions = hosts or secure_bundle_path
             if not db_directions or not keyspace:
@@ -216,6 +295,11 @@ class CassandraOnlineStore(OnlineStore):
                 raise CassandraInvalidConfig(E_CASSANDRA_MISCONFIGURED)
             if (username is None) ^ (password is None):
                 raise CassandraInvalidConfig(E_CASSANDRA_INCONSISTENT_AUTH)
+            if (online_store_config.write_batch_size < 1
+                    or online_store_config.write_concurrency < 1):
+                raise CassandraInvalidConfig(
+                    E_CASSANDRA_NONPOSITIVE_WRITE_SETTINGS
+                )
 
             if username is not None:
                 auth_provider = PlainTextAuthProvider(
@@ -247,14 +331,19 @@ class CassandraOnlineStore(OnlineStore):
                 )
                 execution_profiles = {EXEC_PROFILE_DEFAULT: exe_profile}
             else:
+                # the driver defaults to token-aware routing already
                 execution_profiles = None
 
+            if compression == 'none':
+                compression = False
+
             # additional optional keyword args to Cluster
             cluster_kwargs = {
                 k: v
                 for k, v in {
                     'protocol_version': protocol_version,
                     'execution_profiles': execution_profiles,
+                    'compression': compression,
                 }.items()
                 if v is not None
             }
@@ -280,12 +369,19 @@ class CassandraOnlineStore(OnlineStore):
             # creation of Session
             self._keyspace = keyspace
             self._session = self._cluster.connect(self._keyspace)
+            # the driver picks the libev reactor if it was built with it
+            logger.info(
+                "Connected to Cassandra with "
+                f"{self._cluster.connection_class.__name__}."
+            )
 
         return self._session
 
     def __del__(self):
         if self._session:
             self._session.shutdown()
+        if self._cluster:
+            self._cluster.shutdown()
 
     @log_exceptions_and_usage(online_store="cassandra")
     def online_write_batch(
@@ -313,14 +409,58 @@ class CassandraOnlineStore(OnlineStore):
                       display progress.
         """
         project = config.project
+        # session, table name and statements are resolved once per batch
+        session: Session = self._get_session(config)
+        keyspace: str = self._keyspace
+        fqtable = CassandraOnlineStore._fq_table_name(keyspace, project, table)
+        self._check_table_schema(keyspace, project, table)
+        online_store_config = config.online_store
+        wide = online_store_config.row_layout == 'wide'
+        if wide:
+            write4_cql = self._get_cql_statement(config, 'update3', fqtable)
+            write5_cql = self._get_cql_statement(config, 'update4', fqtable)
+        else:
+            write4_cql = self._get_cql_statement(config, 'insert4', fqtable)
+            write5_cql = self._get_cql_statement(config, 'insert5', fqtable)
+        write_batch_size = online_store_config.write_batch_size
+        write_concurrency = online_store_config.write_concurrency
         #
-        for entity_key, values, timestamp, created_ts in data:
-            entity_key_bin = serialize_entity_key(entity_key).hex()
+        for chunk_start in range(0, len(data), write_batch_size):
+            chunk = data[chunk_start:chunk_start + write_batch_size]
+            # first pass (CPU-bound): encode all values, build bind tuples
+            statements_and_params = []
+            for entity_key, values, timestamp, created_ts in chunk:
+                entity_key_bin = serialize_entity_key(entity_key)
+                # Note: `created_ts` can be None: in that case we avoid
+                # inserting it to prevent unnecessary tombstone creation.
+                if created_ts is None:
+                    write_cql = write4_cql
+                    fixed_vals = (entity_key_bin, timestamp)
+                else:
+                    write_cql = write5_cql
+                    fixed_vals = (entity_key_bin, timestamp, created_ts)
+                if wide:
+                    statements_and_params.append(
+                        CassandraOnlineStore._wide_row_to_write(
+                            write_cql, values.items(), fixed_vals,
+                        )
+                    )
+                else:
+                    statements_and_params.extend(
+                        CassandraOnlineStore._rows_to_write(
+                            write_cql, values.items(), fixed_vals,
+                        )
+                    )
+            # second pass (I/O-bound): inserts are pipelined on the session
+            # (no CQL BATCH here: rows belong to different partitions)
             with tracing_span(name="remote_call"):
-                self._write_rows(config, project, table, entity_key_bin,
-                                 values.items(), timestamp, created_ts)
+                execute_concurrent(
+                    session,
+                    statements_and_params,
+                    concurrency=write_concurrency,
+                )
             if progress:
-                progress(1)
+                progress(len(chunk))
 
     @log_exceptions_and_usage(online_store="cassandra")
     def online_read(
@@ -339,30 +479,60 @@ class CassandraOnlineStore(OnlineStore):
             table: Feast FeatureView.
             entity_keys: a list of entity keys that should be read
                          from the FeatureStore.
+            requested_features: if given, only these features are returned.
         """
         project = config.project
 
         result: List[Tuple[Optional[datetime],
                      Optional[Dict[str, ValueProto]]]] = []
 
-        for entity_key in entity_keys:
-            entity_key_bin = serialize_entity_key(entity_key).hex()
+        entity_key_bins = [
+            serialize_entity_key(entity_key)
+            for entity_key in entity_keys
+        ]
 
-            with tracing_span(name="remote_call"):
-                feature_rows = self._read_rows_by_entity_key(
-                    config, project, table, entity_key_bin,
-                    proj=["feature_name", "value", "event_ts"],
-                )
+        if requested_features is None:
+            requested_set = None
+        else:
+            requested_set = set(requested_features)
 
+        wide = config.online_store.row_layout == 'wide'
+        if wide:
+            # the whole map is read, filtering happens below
+            proj = ["features", "event_ts"]
+            feature_names = None
+        else:
+            proj = ["feature_name", "value", "event_ts"]
+            # short lists are filtered on the clustering column in the
+            # database (long IN clauses may be refused, e.g. by Astra DB);
+            # otherwise, filtering happens below
+            if (requested_features is not None
+                    and len(requested_features) <= MAX_SELECT_IN_FEATURES):
+                feature_names = requested_features
+            else:
+                feature_names = None
+
+        with tracing_span(name="remote_call"):
+            rows_list = self._read_rows_by_entity_keys(
+                config, project, table, entity_key_bins,
+                proj=proj,
+                feature_names=feature_names,
+            )
+
+        value_from_string = ValueProto.FromString
+        for rows in rows_list:
+            if wide:
+                feature_rows = CassandraOnlineStore._unpack_wide_rows(rows)
+            else:
+                feature_rows = rows
             res = {}
             res_ts = None
-            for feature_row in feature_rows:
-                if (requested_features is None
-                        or feature_row.feature_name in requested_features):
-                    val = ValueProto()
-                    val.ParseFromString(feature_row.value)
-                    res[feature_row.feature_name] = val
-                    res_ts = feature_row.event_ts
+            for feature_name, value, event_ts in feature_rows:
+                if requested_set is None or feature_name in requested_set:
+                    res[feature_name] = value_from_string(value)
+                    # rows come in feature_name order: keep the latest ts
+                    if res_ts is None or event_ts > res_ts:
+                        res_ts = event_ts
             #
             if not res:
                 result.append((None, None))
@@ -389,13 +559,30 @@ class CassandraOnlineStore(OnlineStore):
             tables_to_keep: Tables to keep in the Online Store.
         """
         project = config.project
+        session: Session = self._get_session(config)
+        keyspace: str = self._keyspace
 
-        for table in tables_to_keep:
-            with tracing_span(name="remote_call"):
-                self._create_table(config, project, table)
-        for table in tables_to_delete:
-            with tracing_span(name="remote_call"):
-                self._drop_table(config, project, table)
+        # creates and drops are kept in separate phases, with few
+        # schema changes in flight, to avoid schema disagreements
+        with tracing_span(name="remote_call"):
+            CassandraOnlineStore._execute_ddl(session, [
+                self._create_table_op(
+                    config,
+                    CassandraOnlineStore._fq_table_name(
+                        keyspace, project, table,
+                    ),
+                )
+                for table in tables_to_keep
+            ])
+            CassandraOnlineStore._execute_ddl(session, [
+                self._drop_table_op(
+                    config,
+                    CassandraOnlineStore._fq_table_name(
+                        keyspace, project, table,
+                    ),
+                )
+                for table in tables_to_delete
+            ])
 
     @log_exceptions_and_usage(online_store="cassandra")
     def teardown(
@@ -412,10 +599,19 @@ class CassandraOnlineStore(OnlineStore):
             tables: Tables to delete from the feature repo.
         """
         project = config.project
+        session: Session = self._get_session(config)
+        keyspace: str = self._keyspace
 
-        for table in tables:
-            with tracing_span(name="remote_call"):
-                self._drop_table(config, project, table)
+        with tracing_span(name="remote_call"):
+            CassandraOnlineStore._execute_ddl(session, [
+                self._drop_table_op(
+                    config,
+                    CassandraOnlineStore._fq_table_name(
+                        keyspace, project, table,
+                    ),
+                )
+                for table in tables
+            ])
 
     @staticmethod
     def _fq_table_name(
@@ -429,100 +625,193 @@ class CassandraOnlineStore(OnlineStore):
         """
         return f"\"{keyspace}\".\"{project}_{table.name}\""
 
-    def _write_rows(
+    def _check_table_schema(
         self,
-        config: RepoConfig,
+        keyspace: str,
         project: str,
         table: FeatureView,
-        entity_key_bin: bytes,
-        features_vals: Iterable[Tuple[str, ValueProto]],
-        timestamp: datetime,
-        created_ts: Optional[datetime],
     ):
         """
-        Handle the CQL (low-level) insertion of feature values to a table.
-
-        Note: `created_ts` can be None: in that case we avoid explicitly
-        inserting it to prevent unnecessary tombstone creation on Cassandra.
+        Make sure an existing table is not one created by older versions
+        of this plugin (with entity keys as hex strings), based on the
+        cluster metadata. Checked once per table.
         """
-        session: Session = self._get_session(config)
-        keyspace: str = self._keyspace
-        #
         fqtable = CassandraOnlineStore._fq_table_name(keyspace, project, table)
-        if created_ts is None:
-            insert_cql = self._get_cql_statement(
-                config,
-                'insert4',
-                fqtable=fqtable,
-            )
-            fixed_vals = [entity_key_bin, timestamp]
-        else:
-            insert_cql = self._get_cql_statement(
-                config,
-                'insert5',
-                fqtable=fqtable,
-            )
-            fixed_vals = [entity_key_bin, timestamp, created_ts]
-        #
-        for feature_name, val in features_vals:
-            session.execute(
-                insert_cql,
-                [feature_name, val.SerializeToString()] + fixed_vals,
+        if fqtable in self._checked_tables:
+            return
+        keyspace_metadata = self._cluster.metadata.keyspaces.get(keyspace)
+        if keyspace_metadata is None:
+            return
+        table_metadata = keyspace_metadata.tables.get(
+            f"{project}_{table.name}"
+        )
+        if table_metadata is None:
+            return
+        entity_key_column = table_metadata.columns.get("entity_key")
+        if entity_key_column is not None \
+                and entity_key_column.cql_type != "blob":
+            raise CassandraInvalidConfig(
+                E_CASSANDRA_OUTDATED_TABLE_SCHEMA.format(fqtable=fqtable)
             )
+        self._checked_tables.add(fqtable)
+
+    @staticmethod
+    def _rows_to_write(
+        insert_cql: PreparedStatement,
+        features_vals: Iterable[Tuple[str, ValueProto]],
+        fixed_vals: Tuple[Any, ...],
+    ) -> List[Tuple[PreparedStatement, Tuple[Any, ...]]]:
+        """
+        Prepare the CQL (low-level) insertion of feature values to a table,
+        returning a list of (statement, parameters) pairs to be executed.
+
+        Values are serialized here, so that no protobuf encoding is left
+        to do once the statements are dispatched to the database.
+        """
+        return [
+            (insert_cql, (feature_name, val.SerializeToString()) + fixed_vals)
+            for feature_name, val in features_vals
+        ]
+
+    @staticmethod
+    def _wide_row_to_write(
+        update_cql: PreparedStatement,
+        features_vals: Iterable[Tuple[str, ValueProto]],
+        fixed_vals: Tuple[Any, ...],
+    ) -> Tuple[PreparedStatement, Tuple[Any, ...]]:
+        """
+        Prepare the CQL (low-level) upsert of feature values for an entity
+        to a "wide" table, returning a (statement, parameters) pair.
 
-    def _read_rows_by_entity_key(
+        All feature values go into a single map, merged with the stored one.
+        """
+        features_map = {
+            feature_name: val.SerializeToString()
+            for feature_name, val in features_vals
+        }
+        # the entity key is bound last, in the WHERE clause
+        return (
+            update_cql,
+            (features_map,) + fixed_vals[1:] + fixed_vals[:1],
+        )
+
+    @staticmethod
+    def _unpack_wide_rows(
+        rows: ResultSet,
+    ) -> Iterable[Tuple[str, bytes, datetime]]:
+        """
+        Turn rows read from a "wide" table into
+        (feature_name, value, event_ts) triples, as for "tall" tables.
+        """
+        for row in rows:
+            for feature_name, value in (row.features or {}).items():
+                yield feature_name, value, row.event_ts
+
+    def _read_rows_by_entity_keys(
         self,
         config: RepoConfig,
         project: str,
         table: FeatureView,
-        entity_key_bin: bytes,
+        entity_key_bins: List[bytes],
         proj: Optional[List[str]] = None,
-    ) -> ResultSet:
+        feature_names: Optional[List[str]] = None,
+    ) -> List[ResultSet]:
         """
         Handle the CQL (low-level) reading of feature values from a table.
+
+        One query per entity key is issued, all of them concurrently;
+        the returned result sets follow the order of `entity_key_bins`.
+        If `feature_names` is given (only for "tall" tables), rows
+        are restricted to those features.
         """
         session: Session = self._get_session(config)
         keyspace: str = self._keyspace
         #
         fqtable = CassandraOnlineStore._fq_table_name(keyspace, project, table)
-        columns="*" if proj is None else ", ".join(proj)
-        select_cql = self._get_cql_statement(
-            config,
-            'select',
-            fqtable=fqtable,
-            columns=columns,
+        self._check_table_schema(keyspace, project, table)
+        columns = _cols_str(None if proj is None else tuple(proj))
+        if not entity_key_bins:
+            return []
+        if feature_names is None:
+            select_cql = self._get_cql_statement(
+                config,
+                'select',
+                fqtable=fqtable,
+                columns=columns,
+            )
+            params = [(entity_key_bin,) for entity_key_bin in entity_key_bins]
+        else:
+            select_cql = self._get_cql_statement(
+                config,
+                'select_in',
+                fqtable=fqtable,
+                columns=columns,
+            )
+            feature_names = list(feature_names)
+            params = [
+                (entity_key_bin, feature_names)
+                for entity_key_bin in entity_key_bins
+            ]
+        results = execute_concurrent_with_args(
+            session,
+            select_cql,
+            params,
+            concurrency=min(len(entity_key_bins), READ_CONCURRENCY),
         )
-        return session.execute(select_cql, [entity_key_bin])
+        return [result for _, result in results]
 
-    def _drop_table(
+    @staticmethod
+    def _execute_ddl(
+        session: Session,
+        ddl_ops: List[Tuple[str, str]],
+    ):
+        """
+        Execute schema-changing statements, a few at a time.
+        Each op is a (description, CQL statement) pair.
+
+        All statements are run to completion even if some fail: failures
+        are logged and the first one is then raised.
+        """
+        if not ddl_ops:
+            return
+        results = execute_concurrent(
+            session,
+            [(ddl_statement, None) for _, ddl_statement in ddl_ops],
+            concurrency=DDL_CONCURRENCY,
+            raise_on_first_error=False,
+        )
+        errors = []
+        for (description, _), (success, result) in zip(ddl_ops, results):
+            if success:
+                logger.info(f"Done {description}.")
+            else:
+                logger.error(f"Failed {description}: {result}")
+                errors.append(result)
+        if errors:
+            raise errors[0]
+
+    def _drop_table_op(
         self,
         config: RepoConfig,
-        project: str,
-        table: FeatureView,
-    ):
-        """Handle the CQL (low-level) deletion of a table."""
-        session: Session = self._get_session(config)
-        keyspace: str = self._keyspace
-        #
-        fqtable = CassandraOnlineStore._fq_table_name(keyspace, project, table)
+        fqtable: str,
+    ) -> Tuple[str, str]:
+        """Build the CQL (low-level) op to delete a table."""
         drop_cql = self._get_cql_statement(config, 'drop', fqtable)
-        logger.info(f"Deleting table {fqtable}.")
-        session.execute(drop_cql)
+        return f"deleting table {fqtable}", drop_cql
 
-    def _create_table(
+    def _create_table_op(
         self,
         config: RepoConfig,
-        project: str,
-        table: FeatureView,
-    ):
-        """Handle the CQL (low-level) creation of a table."""
-        session: Session = self._get_session(config)
-        keyspace: str = self._keyspace
-        #
-        fqtable = CassandraOnlineStore._fq_table_name(keyspace, project, table)
-        create_cql = self._get_cql_statement(config, 'create', fqtable)
-        logger.info(f"Creating table {fqtable}.")
-        session.execute(create_cql)
+        fqtable: str,
+    ) -> Tuple[str, str]:
+        """Build the CQL (low-level) op to create a table."""
+        if config.online_store.row_layout == 'wide':
+            create_cql = self._get_cql_statement(
+                config, 'create_wide', fqtable,
+            )
+        else:
+            create_cql = self._get_cql_statement(config, 'create', fqtable)
+        return f"creating table {fqtable}", create_cql
 
     def _get_cql_statement(
         self,
@@ -536,25 +825,32 @@ class CassandraOnlineStore(OnlineStore):
         ready to be bound to parameters when executing.
 
         If the statement is defined to be 'prepared', use an instance-specific
-        cache of prepared statements.
+        cache of prepared statements (keyed also by the session).
 
         This additional layer makes it easy to control whether to use prepared
         statements and, if so, on which database operations.
         """
-        session: Session = self._get_session(config)
-        #
         template, prepare = CQL_TEMPLATE_MAP[op_name]
-        statement = template.format(
-            fqtable=fqtable,
-            **kwargs,
-        )
         if prepare:
-            # using the statement itself as key (no problem with that)
-            cache_key = statement
-            if cache_key not in self._prepared_statements:
+            # the only templated parameters besides 'fqtable' are the
+            # 'columns' of a select: no need to format the CQL to get a key
+            session: Session = self._get_session(config)
+            if op_name in ('select', 'select_in'):
+                cache_key = (id(session), op_name, fqtable, kwargs['columns'])
+            else:
+                cache_key = (id(session), op_name, fqtable)
+            prepared = self._prepared_statements.get(cache_key)
+            if prepared is None:
+                statement = template.format(
+                    fqtable=fqtable,
+                    **kwargs,
+                )
                 logger.info(f"Preparing a {op_name} statement on {fqtable}.")
-                self._prepared_statements[cache_key] = \
-                    session.prepare(statement)
-            return self._prepared_statements[cache_key]
+                prepared = session.prepare(statement)
+                self._prepared_statements[cache_key] = prepared
+            return prepared
         else:
-            return statement
+            return template.format(
+                fqtable=fqtable,
+                **kwargs,
+            )